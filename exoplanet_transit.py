@@ -0,0 +1,25 @@
+import numpy as np
+from numba import njit
+
+
+# --- 통과법 밝기 곡선 계산 커널 ---
+# Streamlit은 페이지 스크립트를 매 실행마다 다시 실행하므로, 커널을 페이지 밖의 모듈에 두어
+# sys.modules에 남아 있는 하나의 디스패처를 재사용합니다 (JIT 컴파일은 프로세스당 한 번).
+
+@njit(cache=True, fastmath=True)
+def transit_kernel(planet_radius, orbital_period, star_brightness):
+    n = 100
+    time = np.empty(n)
+    brightness = np.empty(n)
+    transit_duration = orbital_period * 0.1  # 통과 시간은 주기의 10%
+    transit_start = orbital_period * 0.4
+    transit_end = transit_start + transit_duration
+    dimmed = star_brightness * (1 - (planet_radius / 10) ** 2)
+    for i in range(n):
+        t = i * orbital_period / (n - 1)
+        time[i] = t
+        if transit_start <= t <= transit_end:
+            brightness[i] = dimmed
+        else:
+            brightness[i] = star_brightness
+    return time, brightness
@@ -1,31 +1,64 @@
 import streamlit as st
+  import os
   import pandas as pd
   import plotly.express as px
   import plotly.graph_objects as go
   import numpy as np
+  from exoplanet_transit import transit_kernel
+
+  # 외계 행성 데이터 파일 경로
+  DATA_PATH = "data/exoplanets.csv"
+
+  # 이 페이지에서 사용하는 열만 읽습니다
+  DATA_COLUMNS = ["pl_name", "pl_orbsmax", "pl_orbper", "pl_rade", "st_spectype"]
+
+  # 사이드바에서 선택할 수 있는 행성계
+  SYSTEMS = ["TRAPPIST-1", "Kepler-452", "Proxima Centauri"]
+
+  # 궤도 원을 그리는 데 쓰는 각도와 cos/sin 값 (한 번만 계산)
+  ORBIT_ANGLE = np.linspace(0, 2 * np.pi, 100)
+  ORBIT_COS = np.cos(ORBIT_ANGLE)
+  ORBIT_SIN = np.sin(ORBIT_ANGLE)
 
   # 페이지 설정
   st.set_page_config(page_title="Exoplanet Explorer", layout="wide")
 
-  # 데이터 로드
-  @st.cache_data
+  # 데이터 로드 (디스크에 캐시하여 앱을 다시 시작해도 CSV를 다시 파싱하지 않음)
+  # data_version은 파일의 (수정 시각, 크기)로, 파일이 바뀌면 캐시 키도 바뀝니다
+  # 경로, 열 목록, 행성계 목록도 인자로 받아 캐시 키에 포함시킵니다 (전역 변수는 키에 들어가지 않음)
+  @st.cache_data(persist="disk", show_spinner=False)
+  def read_data(data_version, data_path, columns, systems):
+      df = pd.read_csv(data_path, engine="pyarrow", usecols=list(columns))
+      # 시각화에는 float32 정밀도로 충분하고, 분광형은 종류가 적어 범주형으로 저장합니다
+      for column in ("pl_orbsmax", "pl_orbper", "pl_rade"):
+          df[column] = pd.to_numeric(df[column], downcast="float")
+      df["st_spectype"] = df["st_spectype"].astype("category")
+      # 행성계 이름을 미리 분류해 두어 매 실행마다 문자열 검색을 하지 않도록 합니다
+      df["system"] = np.select(
+          [df["pl_name"].str.contains(s, case=False, na=False) for s in systems],
+          list(systems), default="Other"
+      )
+      df["system"] = df["system"].astype("category")
+      # 선택 가능한 행성계별 데이터를 미리 나누어 두어 실행 시에는 딕셔너리 조회만 합니다
+      views = {name: df[df["system"] == name] for name in systems}
+      views["All"] = df
+      return df, views
+
+  # 파일이 없을 때의 데모 모드 결과는 디스크 캐시에 남지 않도록 캐시 밖에서 처리합니다
+  # 데이터 버전도 함께 반환하여 그림 캐시 키에 사용합니다 (데모 모드는 None)
   def load_data():
       try:
-          df = pd.read_csv("data/exoplanets.csv")
-          return df
+          stat = os.stat(DATA_PATH)
+          data_version = (stat.st_mtime_ns, stat.st_size)
+          return (data_version, *read_data(data_version, DATA_PATH, tuple(DATA_COLUMNS), tuple(SYSTEMS)))
       except FileNotFoundError:
           st.error("데이터 파일 'data/exoplanets.csv'을 찾을 수 없습니다. 데모 모드로 실행합니다.")
-          return pd.DataFrame()
+          return None, pd.DataFrame(), {}
 
-  # 통과법 시뮬레이션 함수
+  # 통과법 시뮬레이션 함수 (슬라이더 값 조합별로 결과를 캐시)
+  @st.cache_data(max_entries=128)
   def simulate_transit(planet_radius, orbital_period, star_brightness):
-      time = np.linspace(0, orbital_period, 100)
-      brightness = np.ones_like(time) * star_brightness
-      transit_duration = orbital_period * 0.1  # 통과 시간은 주기의 10%
-      transit_start = orbital_period * 0.4
-      transit_end = transit_start + transit_duration
-      brightness[(time >= transit_start) & (time <= transit_end)] *= (1 - (planet_radius / 10) ** 2)
-      return time, brightness
+      return transit_kernel(float(planet_radius), float(orbital_period), float(star_brightness))
 
   # 메인 앱
   st.title("외계 행성 탐사")
@@ -37,74 +70,86 @@ import streamlit as st
   orbital_radius = st.sidebar.slider("궤도 반경 (AU)", 0.01, 2.0, 0.1, step=0.01)
   orbital_period = st.sidebar.slider("궤도 주기 (일)", 1.0, 100.0, 10.0, step=0.1)
   star_brightness = st.sidebar.slider("항성 밝기 (상대값)", 0.8, 1.2, 1.0, step=0.01)
-  selected_system = st.sidebar.selectbox("행성계 선택", ["All", "TRAPPIST-1", "Kepler-452", "Proxima Centauri"])
+  selected_system = st.sidebar.selectbox("행성계 선택", ["All", *SYSTEMS])
 
   # 데이터 로드
-  df = load_data()
-  if not df.empty:
-      if selected_system != "All":
-          system_data = df[df["pl_name"].str.contains(selected_system, na=False, case=False)]
-      else:
-          system_data = df
-  else:
-      system_data = pd.DataFrame()
+  data_version, df, views = load_data()
+  system_data = views.get(selected_system, pd.DataFrame())
 
   # 행성계 맵
   st.header("행성계 맵")
   st.markdown("선택한 행성계의 궤도를 시각화합니다. 슬라이더로 반지름과 궤도를 조정하세요.")
-  fig_map = go.Figure()
-  fig_map.add_trace(go.Scatter(
-      x=[0], y=[0], mode="markers", marker=dict(size=20, color="yellow"), name="항성"
-  ))
-  if not system_data.empty:
-      for _, row in system_data.iterrows():
-          radius = row["pl_orbsmax"] if not pd.isna(row["pl_orbsmax"]) else orbital_radius
-          angle = np.linspace(0, 2 * np.pi, 100)
-          x = radius * np.cos(angle)
-          y = radius * np.sin(angle)
+  # 관련 입력이 바뀔 때만 그림을 다시 만들고, 그 외에는 세션에 저장된 그림을 재사용합니다
+  map_key = (data_version, selected_system, orbital_radius, planet_radius)
+  if st.session_state.get("map_key") != map_key:
+      fig_map = go.Figure()
+      fig_map.add_trace(go.Scatter(
+          x=[0], y=[0], mode="markers", marker=dict(size=20, color="yellow"), name="항성"
+      ))
+      if not system_data.empty:
+          # 행성마다 trace를 추가하지 않고, 모든 궤도를 NaN으로 구분한 하나의 trace로 그립니다
+          radii = system_data["pl_orbsmax"].fillna(orbital_radius).to_numpy()
+          names = system_data["pl_name"].to_numpy()
+          n_planets = len(radii)
+          xs = radii[:, None] * ORBIT_COS[None, :]
+          ys = radii[:, None] * ORBIT_SIN[None, :]
+          gap = np.full((n_planets, 1), np.nan)
           fig_map.add_trace(go.Scatter(
-              x=x, y=y, mode="lines", name=row["pl_name"], line=dict(color="blue")
+              x=np.concatenate([xs, gap], axis=1).ravel(),
+              y=np.concatenate([ys, gap], axis=1).ravel(),
+              mode="lines", name="궤도", line=dict(color="blue"),
+              hovertext=np.repeat(names, xs.shape[1] + 1)
           ))
           fig_map.add_trace(go.Scatter(
-              x=[radius], y=[0], mode="markers", marker=dict(size=planet_radius * 5), name=f"{row['pl_name']} (조정됨)"
+              x=radii, y=np.zeros(n_planets), mode="markers", marker=dict(size=planet_radius * 5),
+              name="행성 (조정됨)", hovertext=names
           ))
-  else:
-      angle = np.linspace(0, 2 * np.pi, 100)
-      x = orbital_radius * np.cos(angle)
-      y = orbital_radius * np.sin(angle)
-      fig_map.add_trace(go.Scatter(
-          x=x, y=y, mode="lines", name="샘플 행성", line=dict(color="blue")
-      ))
-      fig_map.add_trace(go.Scatter(
-          x=[orbital_radius], y=[0], mode="markers", marker=dict(size=planet_radius * 5), name="샘플 행성"
-      ))
-  fig_map.update_layout(
-      title="궤도 맵", xaxis_title="X (AU)", yaxis_title="Y (AU)",
-      showlegend=True, width=600, height=600
-  )
-  st.plotly_chart(fig_map)
+      else:
+          x = orbital_radius * ORBIT_COS
+          y = orbital_radius * ORBIT_SIN
+          fig_map.add_trace(go.Scatter(
+              x=x, y=y, mode="lines", name="샘플 행성", line=dict(color="blue")
+          ))
+          fig_map.add_trace(go.Scatter(
+              x=[orbital_radius], y=[0], mode="markers", marker=dict(size=planet_radius * 5), name="샘플 행성"
+          ))
+      fig_map.update_layout(
+          title="궤도 맵", xaxis_title="X (AU)", yaxis_title="Y (AU)",
+          showlegend=True, width=600, height=600
+      )
+      st.session_state["map_fig"] = fig_map
+      st.session_state["map_key"] = map_key
+  st.plotly_chart(st.session_state["map_fig"])
 
   # 통과법 시뮬레이션
   st.header("통과법 시뮬레이션")
   st.markdown("행성이 항성을 가릴 때 밝기 변화를 시뮬레이션합니다. 매개변수를 조정하여 변화를 확인하세요.")
-  time, brightness = simulate_transit(planet_radius, orbital_period, star_brightness)
-  fig_transit = go.Figure()
-  fig_transit.add_trace(go.Scatter(
-      x=time, y=brightness, mode="lines", name="밝기 곡선", line=dict(color="blue")
-  ))
-  fig_transit.update_layout(
-      title="통과법 밝기 곡선", xaxis_title="시간 (일)", yaxis_title="상대 밝기",
-      showlegend=True, width=600, height=400
-  )
-  st.plotly_chart(fig_transit)
+  # 슬라이더 step 단위로 반올림하여 부동소수점 오차로 캐시 키가 갈라지지 않게 합니다
+  transit_key = (round(planet_radius, 1), round(orbital_period, 1), round(star_brightness, 2))
+  if st.session_state.get("transit_key") != transit_key:
+      time, brightness = simulate_transit(*transit_key)
+      fig_transit = go.Figure()
+      fig_transit.add_trace(go.Scattergl(
+          x=time, y=brightness, mode="lines", name="밝기 곡선", line=dict(color="blue")
+      ))
+      fig_transit.update_layout(
+          title="통과법 밝기 곡선", xaxis_title="시간 (일)", yaxis_title="상대 밝기",
+          showlegend=True, width=600, height=400
+      )
+      st.session_state["transit_fig"] = fig_transit
+      st.session_state["transit_key"] = transit_key
+  st.plotly_chart(st.session_state["transit_fig"])
 
   # 통계적 분포
   if not df.empty:
       st.header("외계 행성 통계")
       st.markdown("궤도 주기와 행성 반지름의 분포를 확인하세요.")
-      fig_stats = px.scatter(
-          system_data, x="pl_orbper", y="pl_rade", color="st_spectype",
-          labels={"pl_orbper": "궤도 주기 (일)", "pl_rade": "행성 반지름 (지구 반지름 단위)"},
-          title="외계 행성 분포"
-      )
-      st.plotly_chart(fig_stats)
+      stats_key = (data_version, selected_system)
+      if st.session_state.get("stats_key") != stats_key:
+          st.session_state["stats_fig"] = px.scatter(
+              system_data, x="pl_orbper", y="pl_rade", color="st_spectype",
+              labels={"pl_orbper": "궤도 주기 (일)", "pl_rade": "행성 반지름 (지구 반지름 단위)"},
+              title="외계 행성 분포"
+          )
+          st.session_state["stats_key"] = stats_key
+      st.plotly_chart(st.session_state["stats_fig"])